@@ -0,0 +1,168 @@
+import argparse
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from branches import data_version
+from shared_cache import get_shared_cache
+from refresh import ARTIFACT_NAME, compute_snapshot, publish_snapshot
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+class ArtifactReader:
+    # Keeps the last published snapshot in memory and reloads it only when its version changes.
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._lock = threading.Lock()
+        # ThreadingHTTPServer runs every request on a new thread, and SharedCache would open a connection per
+        # thread; share one connection instead, used only under the lock.
+        self._conn = cache.reader_connection()
+        # One (version, artifact) tuple, swapped in a single assignment so a reader never mixes two snapshots.
+        self._state = (None, None)
+
+    def get(self):
+        with self._lock:
+            version = self.cache.published_version(ARTIFACT_NAME, self._conn)
+            if version != self._state[0]:
+                self._state = self.cache.published(ARTIFACT_NAME, self._conn)
+            return self._state
+
+def param_values(params, name):
+    # Batch requests: ?branch=a&branch=b or ?branch=a,b
+    return [v.strip() for value in params.get(name, []) for v in value.split(',') if v.strip()]
+
+def selected_branches(artifact, params):
+    branches = param_values(params, 'branch') or list(artifact['branches'])
+    unknown = [b for b in branches if b not in artifact['branches']]
+    if unknown:
+        raise ValueError(f"Cabang tidak dikenal: {', '.join(unknown)}")
+    return branches
+
+def int_param(params, name, default, minimum, maximum):
+    values = params.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise ValueError(f"Parameter {name} harus berupa angka")
+    return min(max(value, minimum), maximum)
+
+def get_branches(artifact, params):
+    return {'as_of': artifact['as_of'], 'branches': list(artifact['branches'])}
+
+def get_forecasts(artifact, params):
+    return {
+        'as_of': artifact['as_of'],
+        'forecasts': {branch: artifact['branches'][branch]['forecast'] for branch in selected_branches(artifact, params)},
+    }
+
+def get_segments(artifact, params):
+    branches = selected_branches(artifact, params)
+    categories = param_values(params, 'category')
+    kode_barang = set(param_values(params, 'kode_barang'))
+    clusters = {int(c) for c in param_values(params, 'cluster') if c.lstrip('-').isdigit()}
+    page = int_param(params, 'page', 1, 1, 10 ** 9)
+    page_size = int_param(params, 'page_size', DEFAULT_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+
+    items = []
+    for branch in branches:
+        segments = artifact['branches'][branch]['segments']
+        for category_name in categories or list(segments):
+            for row in segments.get(category_name, []):
+                if kode_barang and row['kode_barang'] not in kode_barang:
+                    continue
+                if clusters and row['cluster'] not in clusters:
+                    continue
+                items.append(dict(row, branch=branch, category=category_name))
+
+    start = (page - 1) * page_size
+    return {
+        'as_of': artifact['as_of'],
+        'page': page,
+        'page_size': page_size,
+        'total': len(items),
+        'items': items[start:start + page_size],
+    }
+
+ROUTES = {
+    '/branches': get_branches,
+    '/forecasts': get_forecasts,
+    '/segments': get_segments,
+}
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = 'BobbyAquaticAPI/1.0'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        route = ROUTES.get(url.path.rstrip('/') or '/')
+        if route is None:
+            return self.send_json(404, {'error': f"Endpoint tidak ada, pilih salah satu dari {', '.join(ROUTES)}"})
+
+        version, artifact = self.server.reader.get()
+        if artifact is None:
+            return self.send_json(503, {'error': 'Hasil belum tersedia, jalankan dashboard atau api_server.py --build dulu'})
+
+        # The ETag only depends on the snapshot version and the request, so it is known before building the body.
+        etag = '"%s-%s"' % (version, hashlib.sha1(url.query.encode()).hexdigest()[:16])
+        if etag in [t.strip() for t in self.headers.get('If-None-Match', '').split(',')]:
+            return self.send_json(304, None, etag)
+
+        try:
+            body = route(artifact, parse_qs(url.query))
+        except ValueError as e:
+            return self.send_json(400, {'error': str(e)})
+        self.send_json(200, body, etag)
+
+    def send_json(self, status, body, etag=None):
+        payload = b'' if body is None else json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode()
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if body is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def make_server(host='127.0.0.1', port=8502, verbose=False):
+    cache = get_shared_cache()
+    if cache is None:
+        raise RuntimeError("API membaca hasil dari shared cache, BOBBY_SHARED_CACHE tidak boleh kosong")
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    server.reader = ArtifactReader(cache)
+    server.verbose = verbose
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description='API JSON (read-only) untuk prediksi laba dan segmentasi produk.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--build', action='store_true', help='Hitung hasil sekali jika belum ada yang dipublikasikan')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.verbose)
+    if args.build and server.reader.get()[1] is None:
+        publish_snapshot(compute_snapshot(data_version()))
+
+    print(f"API berjalan di http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
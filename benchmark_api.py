@@ -0,0 +1,114 @@
+import argparse
+import json
+import os
+import platform
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from api_server import make_server
+
+REQUESTS = [
+    '/branches',
+    '/forecasts',
+    '/segments?category=Ikan&page=1&page_size=100',
+    '/segments?category=Aksesoris&page=2&page_size=100',
+]
+
+
+def fetch(url, etag=None):
+    request = urllib.request.Request(url, headers={'If-None-Match': etag} if etag else {})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            status, etag = response.status, response.headers.get('ETag')
+    except urllib.error.HTTPError as e:
+        status, etag = e.code, e.headers.get('ETag')
+    return status, etag, time.perf_counter() - start
+
+
+def run_load(base_url, concurrency, duration, conditional):
+    etags = {}
+    if conditional:
+        for path in REQUESTS:
+            etags[path] = fetch(base_url + path)[1]
+
+    latencies, statuses = [], {}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(worker):
+        i = worker
+        while time.perf_counter() < deadline:
+            path = REQUESTS[i % len(REQUESTS)]
+            status, _, seconds = fetch(base_url + path, etags.get(path))
+            with lock:
+                latencies.append(seconds)
+                statuses[status] = statuses.get(status, 0) + 1
+            i += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(client, range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'requests_per_second': len(latencies) / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000 if latencies else None,
+        'p95_ms': latencies[int(len(latencies) * 0.95)] * 1000 if latencies else None,
+        'statuses': {str(k): v for k, v in statuses.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ukur throughput API JSON di bawah beban konkuren.')
+    parser.add_argument('--url', help='API yang sudah berjalan; tanpa ini server dijalankan di proses ini')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--label', default=datetime.now().strftime('%Y%m%d-%H%M%S'))
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = make_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    status = fetch(base_url + '/branches')[0]
+    if status != 200:
+        raise SystemExit(f"API menjawab {status}, jalankan dashboard atau api_server.py --build dulu")
+
+    results = {
+        'label': args.label,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'runs': [],
+    }
+    for concurrency in args.concurrency:
+        for conditional in (False, True):
+            run = run_load(base_url, concurrency, args.duration, conditional)
+            run.update(concurrency=concurrency, conditional=conditional)
+            results['runs'].append(run)
+            print(f"{concurrency:>4} klien {'If-None-Match' if conditional else 'penuh':<14} "
+                  f"{run['requests_per_second']:>9.1f} req/s  p50 {run['p50_ms']:.1f} ms  p95 {run['p95_ms']:.1f} ms  {run['statuses']}")
+
+    if server is not None:
+        server.shutdown()
+
+    output_path = os.path.join('benchmark_results', f'api-{args.label}.json')
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nHasil disimpan di {output_path}")
+
+
+if __name__ == '__main__':
+    main()
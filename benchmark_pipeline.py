@@ -0,0 +1,162 @@
+import argparse
+import inspect
+import json
+import os
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+import matplotlib
+matplotlib.use('Agg')
+
+from sklearn.preprocessing import StandardScaler
+
+import generate_synthetic_data as synthetic
+from branches import load_all_excel_files
+from products import MASTER_DATA_FILE, load_product_dimension, category_id
+from sales_forecast import forecast_profit
+from product_clustering import CATEGORIES, process_rfm, get_optimal_k
+
+SCALES = (1, 10, 100)
+SHEET_NAME = 'Penjualan'
+
+
+def uncached(func):
+    # Benchmark the computation itself, not a st.cache_data hit.
+    return inspect.unwrap(func)
+
+
+def stage_load(folder_path, master_path):
+    return uncached(load_all_excel_files)(folder_path, SHEET_NAME, master_path)
+
+
+def stage_forecast(data):
+    return uncached(forecast_profit)(data)
+
+
+def stage_rfm(data, products):
+    return process_rfm(data, products)
+
+
+def stage_optimal_k(rfm, products):
+    return {
+        kategori: get_optimal_k(StandardScaler().fit_transform(rfm[rfm['KATEGORI_ID'] == category_id(products, kategori)][['Recency', 'Frequency', 'Monetary']]))
+        for kategori in CATEGORIES
+    }
+
+
+def measure(func, *args, repeat=1, memory=True):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        func(*args)
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+
+    return result, min(timings), peak_mb
+
+
+def prepare_scale(work_dir, scale, branches, years, products):
+    scale_dir = os.path.join(work_dir, f'scale_{scale}')
+    marker = os.path.join(scale_dir, '.complete')
+    if not os.path.exists(marker):
+        synthetic.write_synthetic_data(scale_dir, n_branches=branches, years=years,
+                                       rows_per_year=synthetic.BASE_ROWS_PER_YEAR * scale,
+                                       n_products=products)
+        open(marker, 'w').close()
+    branch_folders = sorted(
+        os.path.join(scale_dir, name) for name in os.listdir(scale_dir)
+        if os.path.isdir(os.path.join(scale_dir, name))
+    )
+    return branch_folders, os.path.join(scale_dir, MASTER_DATA_FILE)
+
+
+def run_scale(branch_folders, master_path, repeat, memory):
+    stages = {}
+
+    def record(name, seconds, peak_mb):
+        stage = stages.setdefault(name, {'seconds': 0.0, 'peak_mb': None})
+        stage['seconds'] += seconds
+        if peak_mb is not None:
+            stage['peak_mb'] = max(stage['peak_mb'] or 0.0, peak_mb)
+
+    products = uncached(load_product_dimension)(master_path)
+
+    rows = 0
+    for folder_path in branch_folders:
+        data, seconds, peak_mb = measure(stage_load, folder_path, master_path, repeat=repeat, memory=memory)
+        record('load_all_excel_files', seconds, peak_mb)
+        rows += len(data)
+
+        _, seconds, peak_mb = measure(stage_forecast, data, repeat=repeat, memory=memory)
+        record('forecast_profit', seconds, peak_mb)
+
+        rfm, seconds, peak_mb = measure(stage_rfm, data, products, repeat=repeat, memory=memory)
+        record('process_rfm', seconds, peak_mb)
+
+        _, seconds, peak_mb = measure(stage_optimal_k, rfm, products, repeat=repeat, memory=memory)
+        record('get_optimal_k', seconds, peak_mb)
+
+    return {'rows': rows, 'branches': len(branch_folders), 'stages': stages}
+
+
+def print_results(results, baseline=None):
+    for scale, result in results['scales'].items():
+        print(f"\nSkala {scale}x: {result['rows']:,} baris, {result['branches']} cabang")
+        base_stages = (baseline or {}).get('scales', {}).get(scale, {}).get('stages', {})
+        for name, stage in result['stages'].items():
+            line = f"  {name:<22} {stage['seconds']:>10.3f} s"
+            if stage['peak_mb'] is not None:
+                line += f" {stage['peak_mb']:>10.1f} MB"
+            if name in base_stages and base_stages[name]['seconds']:
+                line += f"  ({stage['seconds'] / base_stages[name]['seconds']:.2f}x vs baseline)"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ukur waktu dan memori tiap tahap pipeline pada data sintetis.')
+    parser.add_argument('--scales', type=int, nargs='+', default=list(SCALES))
+    parser.add_argument('--branches', type=int, default=synthetic.BASE_BRANCHES)
+    parser.add_argument('--years', type=int, nargs='+', default=list(synthetic.BASE_YEARS))
+    parser.add_argument('--products', type=int, default=synthetic.BASE_PRODUCTS)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--no-memory', action='store_true')
+    parser.add_argument('--work-dir', default=os.path.join('benchmark_results', 'data'))
+    parser.add_argument('--label', default=datetime.now().strftime('%Y%m%d-%H%M%S'))
+    parser.add_argument('--compare', help='File hasil sebelumnya untuk dibandingkan')
+    args = parser.parse_args()
+
+    results = {
+        'label': args.label,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'scales': {},
+    }
+    for scale in args.scales:
+        branch_folders, master_path = prepare_scale(args.work_dir, scale, args.branches, args.years, args.products)
+        results['scales'][str(scale)] = run_scale(branch_folders, master_path, args.repeat, not args.no_memory)
+
+    output_path = os.path.join('benchmark_results', f'{args.label}.json')
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print_results(results, baseline)
+    print(f"\nHasil disimpan di {output_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+import os
+import re
+import glob
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import streamlit as st
+from products import MASTER_DATA_FILE, load_product_dimension, encode_products
+from shared_cache import shared_cache
+from transaction_store import get_transaction_store
+
+DATA_DIR = './data'
+SHEET_NAME = 'Penjualan'
+BRANCH_PREFIX = 'Bobby Aquatic '
+# st.cache_data size for per-branch results. The workbook version is part of every key, so each save adds an
+# entry; capping at about one per branch (raise it for more than 8 shops) lets a long-running worker drop the
+# superseded frames and results. The current ones are held by the refresh Snapshot anyway.
+CACHE_ENTRIES = 8
+
+def natural_key(name):
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+def discover_branches(data_dir=DATA_DIR):
+    branches = []
+    for name in os.listdir(data_dir):
+        folder_path = os.path.join(data_dir, name)
+        # Skip Windows "- Copy" duplicates so a backup folder is not shown as another shop.
+        if not os.path.isdir(folder_path) or name.endswith(' - Copy'):
+            continue
+        if glob.glob(os.path.join(folder_path, '*.xlsm')):
+            branches.append(name)
+    return sorted(branches, key=natural_key)
+
+def branch_label(branch):
+    if branch.startswith(BRANCH_PREFIX):
+        return f"Cabang {branch[len(BRANCH_PREFIX):]}"
+    return branch
+
+def branch_folder(branch, data_dir=DATA_DIR):
+    return os.path.join(data_dir, branch)
+
+def master_data_path(data_dir=DATA_DIR):
+    return os.path.join(data_dir, MASTER_DATA_FILE)
+
+def files_version(*paths):
+    # (path, mtime, size) of every workbook involved; part of the cache key so edited files are reloaded.
+    # A missing file (e.g. no MASTER DATA.xlsm yet) is left out; loading it reports the error instead.
+    version = []
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, "*.xlsm"))) if os.path.isdir(path) else [path]
+        for file in files:
+            try:
+                stat = os.stat(file)
+            except FileNotFoundError:
+                continue
+            version.append((file, stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+def data_version(data_dir=DATA_DIR):
+    return files_version(master_data_path(data_dir), *[branch_folder(b, data_dir) for b in discover_branches(data_dir)])
+
+def load_products(data_dir=DATA_DIR):
+    master_path = master_data_path(data_dir)
+    return load_product_dimension(master_path, version=files_version(master_path))
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+@shared_cache
+def load_all_excel_files(folder_path, sheet_name, master_path, version=None):
+    products = load_product_dimension(master_path, version=files_version(master_path))
+    dfs = []
+    for file in sorted(glob.glob(os.path.join(folder_path, "*.xlsm"))):
+        df = pd.read_excel(file, sheet_name=sheet_name)
+        df = df.loc[:, ~df.columns.duplicated()]
+        dfs.append(encode_products(df, products))
+    return pd.concat(dfs, ignore_index=True)
+
+def load_branch(branch, data_dir=DATA_DIR):
+    folder_path = branch_folder(branch, data_dir)
+    master_path = master_data_path(data_dir)
+    return load_all_excel_files(folder_path, SHEET_NAME, master_path, files_version(folder_path, master_path))
+
+def branch_transactions(branch, columns=None, start=None, end=None, kategori_ids=None, data_dir=DATA_DIR):
+    store = get_transaction_store()
+    if store is None:
+        data = load_branch(branch, data_dir)
+        tanggal = data['TANGGAL'].dt.normalize()
+        mask = pd.Series(True, index=data.index)
+        if start is not None:
+            mask &= tanggal >= pd.Timestamp(start).normalize()
+        if end is not None:
+            mask &= tanggal <= pd.Timestamp(end).normalize()
+        if kategori_ids is not None:
+            mask &= data['KATEGORI_ID'].isin(kategori_ids)
+        data = data[mask]
+        return data[list(columns)] if columns else data
+
+    # The workbooks are parsed only when they changed since the last ingest, otherwise the filters run in SQL.
+    folder_path = branch_folder(branch, data_dir)
+    version = files_version(folder_path, master_data_path(data_dir))
+    if not store.has_version(branch, version):
+        store.ingest(branch, load_branch(branch, data_dir), version)
+    return store.query(branch, columns, start, end, kategori_ids)
+
+def run_per_branch(pipeline, branches, max_workers=None):
+    if not branches:
+        return {}
+    # Threads, not processes: spawned workers would re-run the Streamlit script (it is __main__ here). They overlap
+    # the numpy/statsmodels parts of each pipeline, but workbook parsing holds the GIL and stays serial, so an
+    # uncached load takes about as long as loading the branches one by one.
+    with ThreadPoolExecutor(max_workers=max_workers or len(branches), thread_name_prefix='branch') as executor:
+        return dict(zip(branches, executor.map(pipeline, branches)))
@@ -1,9 +1,8 @@
 import streamlit as st
-import pandas as pd
-from sales_forecast1 import load_all_excel_files as load_data_1, forecast_profit as forecast_profit_1, show_dashboard
-from sales_forecast2 import load_all_excel_files as load_data_2, forecast_profit as forecast_profit_2
-from product_clustering import load_all_excel_files as load_cluster_data_1, show_dashboard as show_cluster_dashboard_1
-from product_clustering2 import load_all_excel_files as load_cluster_data_2, show_dashboard as show_cluster_dashboard_2
+from branches import branch_label
+from sales_forecast import show_dashboard
+from product_clustering import show_dashboard as show_cluster_dashboard
+from refresh import RETRY_SECONDS, get_refresh_worker
 
 st.set_page_config(page_title="Bobby Aquatic Dashboard", layout="wide")
 
@@ -44,73 +43,48 @@ with st.sidebar:
     if st.button('📦 Produk', key="product_button"):
         switch_page("product")
 
-if st.session_state.page == "sales":
-    st.header("📈 Dashboard Penjualan Bobby Aquatic")
+snapshot, refreshing, error = get_refresh_worker().get()
 
-    branch_selection = st.multiselect(
-        "Pilih cabang untuk ditampilkan:",
-        options=["Bobby Aquatic 1", "Bobby Aquatic 2"],
-        default=["Bobby Aquatic 1", "Bobby Aquatic 2"]
-    )
+if snapshot is None:
+    st.error(f"Data gagal dimuat ({error}). Coba muat ulang halaman dalam {RETRY_SECONDS} detik.")
+    st.stop()
 
-    if "Bobby Aquatic 1" in branch_selection:
-        folder_path_1 = "./data/Bobby Aquatic 1"
-        sheet_name_1 = 'Penjualan'
-        penjualan_data_1 = load_data_1(folder_path_1, sheet_name_1)
-
-        daily_profit_1, fitted_values_1, test_1, test_forecast_1, hw_forecast_future_1 = forecast_profit_1(penjualan_data_1)
-
-    if "Bobby Aquatic 2" in branch_selection:
-        folder_path_2 = "./data/Bobby Aquatic 2"
-        sheet_name_2 = 'Penjualan'
-        penjualan_data_2 = load_data_2(folder_path_2, sheet_name_2)
-
-        daily_profit_2, fitted_values_2, test_2, test_forecast_2, hw_forecast_future_2 = forecast_profit_2(penjualan_data_2)
-
-    if "Bobby Aquatic 1" in branch_selection and "Bobby Aquatic 2" in branch_selection:
-        combined_penjualan_data = pd.concat([penjualan_data_1, penjualan_data_2], ignore_index=True)
-
-        daily_profit_combined, fitted_values_combined, test_combined, test_forecast_combined, hw_forecast_future_combined = forecast_profit_1(combined_penjualan_data)
-
-    if "Bobby Aquatic 1" in branch_selection and "Bobby Aquatic 2" in branch_selection:
-        show_dashboard(
-            daily_profit_1, fitted_values_1, test_1, test_forecast_1, hw_forecast_future_1, 
-            daily_profit_2, fitted_values_2, test_2, test_forecast_2, hw_forecast_future_2,
-            key_suffix='combined'
-        )
-    elif "Bobby Aquatic 1" in branch_selection:
-        show_dashboard(
-            daily_profit_1, fitted_values_1, test_1, test_forecast_1, hw_forecast_future_1, 
-            None, None, None, None, None, key_suffix='cabang1'
-        )
-    elif "Bobby Aquatic 2" in branch_selection:
-        show_dashboard(
-            None, None, None, None, None,
-            daily_profit_2, fitted_values_2, test_2, test_forecast_2, hw_forecast_future_2, 
-            key_suffix='cabang2'
-        )
+branches = snapshot.branches
 
-elif st.session_state.page == "product":
-    st.header("🔍 Segmentasi Produk Bobby Aquatic")
+with st.sidebar:
+    if snapshot.as_of is not None:
+        st.caption(f"Data per {snapshot.as_of:%d-%m-%Y %H:%M}")
+    if refreshing:
+        st.caption("Data baru sedang diproses, hasil di atas masih versi sebelumnya.")
+    elif error is not None:
+        st.caption(f"Pembaruan data terakhir gagal ({error}), hasil di atas masih versi sebelumnya.")
 
-    tab1, tab2 = st.tabs(["Bobby Aquatic 1", "Bobby Aquatic 2"])
+if not branches:
+    st.error("Tidak ada data cabang di folder data.")
 
-    with tab1:
-        st.header("Segmentasi Produk Bobby Aquatic 1")
+elif st.session_state.page == "sales":
+    st.header("📈 Dashboard Penjualan Bobby Aquatic")
 
-        folder_path_1 = "./data/Bobby Aquatic 1"
-        sheet_name_1 = 'Penjualan'
-        cluster_data_1 = load_cluster_data_1(folder_path_1, sheet_name_1)
+    branch_selection = st.multiselect(
+        "Pilih cabang untuk ditampilkan:",
+        options=branches,
+        default=branches
+    )
 
-        show_cluster_dashboard_1(cluster_data_1, key_suffix='cabang1')
+    for branch in branch_selection:
+        if snapshot.forecasts[branch] is None:
+            st.info(f"Riwayat penjualan {branch_label(branch)} belum cukup panjang untuk prediksi laba.")
 
-    with tab2:
-        st.header("Segmentasi Produk Bobby Aquatic 2")
+    forecasts = {branch_label(branch): snapshot.forecasts[branch] for branch in branch_selection if snapshot.forecasts[branch] is not None}
+    if forecasts:
+        show_dashboard(forecasts, key_suffix='sales')
 
-        folder_path_2 = "./data/Bobby Aquatic 2"
-        sheet_name_2 = 'Penjualan'
-        cluster_data_2 = load_cluster_data_2(folder_path_2, sheet_name_2)
+elif st.session_state.page == "product":
+    st.header("🔍 Segmentasi Produk Bobby Aquatic")
 
-        show_cluster_dashboard_2(cluster_data_2, key_suffix='cabang2')
+    for tab, branch in zip(st.tabs(branches), branches):
+        with tab:
+            st.header(f"Segmentasi Produk {branch}")
+            show_cluster_dashboard(snapshot.segments[branch], snapshot.products, key_suffix=branch_label(branch).lower().replace(' ', ''))
 
 st.markdown("<div class='footer'>© 2024 Bobby Aquatic. All rights reserved.</div>", unsafe_allow_html=True)
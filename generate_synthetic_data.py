@@ -0,0 +1,123 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from products import MASTER_DATA_FILE, MASTER_SHEET_NAME
+
+SHEET_NAME = 'Penjualan'
+COLUMNS = ['TANGGAL', 'KODE TRANSAKSI', 'KODE BARANG', 'NAMA BARANG', 'JUMLAH', 'HARGA BELI',
+           'HARGA JUAL', 'TOTAL HR BELI', 'TOTAL HR JUAL', 'LABA', 'KATEGORI']
+
+# Volume of the real workbooks: 2 branches x 4 years, ~5000 filled rows per branch-year, ~500 products.
+BASE_BRANCHES = 2
+BASE_YEARS = (2021, 2022, 2023, 2024)
+BASE_ROWS_PER_YEAR = 5000
+BASE_PRODUCTS = 500
+
+# Excel caps a sheet at 1,048,576 rows, bigger branch-years are split over several workbooks.
+MAX_SHEET_ROWS = 1_000_000
+IKAN_SHARE = 0.15
+
+
+def generate_products(n_products, seed=0):
+    rng = np.random.default_rng(seed)
+    n_ikan = max(1, int(round(n_products * IKAN_SHARE)))
+    is_ikan = np.arange(n_products) < n_ikan
+
+    kode = np.where(is_ikan, 'IK', 'AK').astype(object) + (np.arange(n_products) + 1).astype(str).astype(object)
+    nama = np.where(is_ikan, 'IKAN ', 'AKSESORIS ').astype(object) + (np.arange(n_products) + 1).astype(str).astype(object)
+
+    harga_beli = np.where(is_ikan, rng.lognormal(9.5, 0.9, n_products), rng.lognormal(10.5, 1.1, n_products))
+    harga_beli = np.maximum(np.round(harga_beli / 500) * 500, 500)
+    harga_jual = np.round(harga_beli * rng.uniform(1.2, 1.8, n_products) / 500) * 500
+
+    return pd.DataFrame({
+        'KODE BARANG': kode,
+        'NAMA BARANG': nama,
+        'HARGA BELI': harga_beli,
+        'HARGA JUAL': harga_jual,
+        'KATEGORI': np.where(is_ikan, 'Ikan', 'Aksesoris'),
+    })
+
+
+def generate_sales(products, year, n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    # A few products sell far more often than the rest, like the real catalog.
+    popularity = 1.0 / np.arange(1, len(products) + 1) ** 0.8
+    popularity = rng.permutation(popularity)
+    product_idx = rng.choice(len(products), size=n_rows, p=popularity / popularity.sum())
+
+    days = pd.date_range(f'{year}-01-01', f'{year}-12-31', freq='D')
+    day_weight = 1 + 0.3 * np.sin(2 * np.pi * np.arange(len(days)) / len(days)) + 0.4 * (days.dayofweek >= 5)
+    day_idx = np.sort(rng.choice(len(days), size=n_rows, p=day_weight / day_weight.sum()))
+
+    jumlah = rng.poisson(0.5, n_rows) + 1
+    harga_beli = products['HARGA BELI'].to_numpy()[product_idx]
+    harga_jual = products['HARGA JUAL'].to_numpy()[product_idx]
+    total_beli = harga_beli * jumlah
+    total_jual = harga_jual * jumlah
+
+    return pd.DataFrame({
+        'TANGGAL': days[day_idx],
+        # Year prefix shifted past the row count, so codes stay unique across years at any scale.
+        'KODE TRANSAKSI': year * 10 ** len(str(n_rows)) + np.arange(1, n_rows + 1),
+        'KODE BARANG': products['KODE BARANG'].to_numpy()[product_idx],
+        'NAMA BARANG': products['NAMA BARANG'].to_numpy()[product_idx],
+        'JUMLAH': jumlah,
+        'HARGA BELI': harga_beli,
+        'HARGA JUAL': harga_jual,
+        'TOTAL HR BELI': total_beli,
+        'TOTAL HR JUAL': total_jual,
+        'LABA': total_jual - total_beli,
+        'KATEGORI': products['KATEGORI'].to_numpy()[product_idx],
+    }, columns=COLUMNS)
+
+
+def write_sales_workbooks(sales, folder_path, file_stem):
+    paths = []
+    n_parts = max(1, -(-len(sales) // MAX_SHEET_ROWS))
+    for part in range(n_parts):
+        chunk = sales.iloc[part * MAX_SHEET_ROWS:(part + 1) * MAX_SHEET_ROWS]
+        suffix = f' ({part + 1})' if n_parts > 1 else ''
+        file_path = os.path.join(folder_path, f'{file_stem}{suffix}.xlsm')
+        chunk.to_excel(file_path, sheet_name=SHEET_NAME, index=False, engine='openpyxl')
+        paths.append(file_path)
+    return paths
+
+
+def write_synthetic_data(output_dir, n_branches=BASE_BRANCHES, years=BASE_YEARS,
+                         rows_per_year=BASE_ROWS_PER_YEAR, n_products=BASE_PRODUCTS, seed=0):
+    products = generate_products(n_products, seed=seed)
+    os.makedirs(output_dir, exist_ok=True)
+    products.to_excel(os.path.join(output_dir, MASTER_DATA_FILE), sheet_name=MASTER_SHEET_NAME, index=False, engine='openpyxl')
+
+    branch_folders = []
+    for branch in range(1, n_branches + 1):
+        folder_path = os.path.join(output_dir, f'Bobby Aquatic {branch}')
+        os.makedirs(folder_path, exist_ok=True)
+        for year in years:
+            sales = generate_sales(products, year, rows_per_year, seed=seed * 100003 + branch * 101 + year)
+            write_sales_workbooks(sales, folder_path, f'PENJUALAN BA{branch} {year}')
+        branch_folders.append(folder_path)
+    return branch_folders
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tulis workbook penjualan sintetis dengan format sheet Penjualan.')
+    parser.add_argument('output_dir')
+    parser.add_argument('--branches', type=int, default=BASE_BRANCHES)
+    parser.add_argument('--years', type=int, nargs='+', default=list(BASE_YEARS))
+    parser.add_argument('--rows-per-year', type=int, default=BASE_ROWS_PER_YEAR)
+    parser.add_argument('--products', type=int, default=BASE_PRODUCTS)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    folders = write_synthetic_data(args.output_dir, args.branches, args.years,
+                                   args.rows_per_year, args.products, args.seed)
+    for folder in folders:
+        print(folder)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,66 +1,67 @@
-import glob
-import os
+import numpy as np
 import pandas as pd
+from matplotlib.figure import Figure
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
 import streamlit as st
 import plotly.graph_objects as go
 from yellowbrick.cluster import KElbowVisualizer
-
-@st.cache_data
-def load_all_excel_files(folder_path, sheet_name):
-    all_files = glob.glob(os.path.join(folder_path, "*.xlsm"))
-    dfs = []
-    for file in all_files:
-        df = pd.read_excel(file, sheet_name=sheet_name)
-        if 'KODE BARANG' in df.columns:
-            df = df.loc[:, ~df.columns.duplicated()]
-        dfs.append(df)
-    return pd.concat(dfs, ignore_index=True)
-
-def process_rfm(data):
-    data['TANGGAL'] = pd.to_datetime(data['TANGGAL'])
-    reference_date = data['TANGGAL'].max()
-
-    rfm = data.groupby(['NAMA BARANG', 'KATEGORI']).agg({
-        'TANGGAL': lambda x: (reference_date - x.max()).days,  
-        'KODE BARANG': 'count',  
-        'TOTAL HR JUAL': 'sum'  
+from branches import CACHE_ENTRIES, DATA_DIR, branch_transactions, load_products
+from products import category_id, product_names
+from shared_cache import shared_cache
+
+CATEGORIES = ['Ikan', 'Aksesoris']
+SORT_COLUMNS = ['NAMA BARANG', 'Recency', 'Frequency', 'Monetary']
+PAGE_SIZES = [25, 50, 100]
+RFM_COLUMNS = ['Recency', 'Frequency', 'Monetary']
+RFM_QUANTILES = [0.2, 0.4, 0.6, 0.8]
+RFM_LABELS = {
+    'Recency': ['Baru Saja', 'Cukup Baru', 'Cukup Lama', 'Lama', 'Sangat Lama'],
+    'Frequency': ['Sangat Jarang', 'Jarang', 'Cukup Sering', 'Sering', 'Sangat Sering'],
+    'Monetary': ['Sangat Rendah', 'Rendah', 'Sedang', 'Tinggi', 'Sangat Tinggi'],
+}
+
+def process_rfm(data, products):
+    data = data[data['PRODUCT_ID'] >= 0]
+    tanggal = pd.to_datetime(data['TANGGAL'])
+    reference_date = tanggal.max()
+
+    grouped = data.groupby('PRODUCT_ID')
+    rfm = pd.DataFrame({
+        'Recency': (reference_date - tanggal.groupby(data['PRODUCT_ID']).max()).dt.days,
+        'Frequency': grouped.size(),
+        'Monetary': grouped['TOTAL HR JUAL'].sum(),
     }).reset_index()
-    
-    rfm.columns = ['NAMA BARANG', 'KATEGORI', 'Recency', 'Frequency', 'Monetary']
-    return rfm
 
-def categorize_rfm(rfm):
-    recency_q1 = rfm['Recency'].quantile(0.2)
-    recency_q2 = rfm['Recency'].quantile(0.4)
-    recency_q3 = rfm['Recency'].quantile(0.6)
-    recency_q4 = rfm['Recency'].quantile(0.8)
-    
-    frequency_q1 = rfm['Frequency'].quantile(0.2)
-    frequency_q2 = rfm['Frequency'].quantile(0.4)
-    frequency_q3 = rfm['Frequency'].quantile(0.6)
-    frequency_q4 = rfm['Frequency'].quantile(0.8)
-    
-    monetary_q1 = rfm['Monetary'].quantile(0.2)
-    monetary_q2 = rfm['Monetary'].quantile(0.4)
-    monetary_q3 = rfm['Monetary'].quantile(0.6)
-    monetary_q4 = rfm['Monetary'].quantile(0.8)
+    rfm.insert(1, 'KATEGORI_ID', products['KATEGORI'].cat.codes.to_numpy()[rfm['PRODUCT_ID']])
+    return rfm
 
-    recency_bins = [0, recency_q1, recency_q2, recency_q3, recency_q4, float('inf')]
-    frequency_bins = [0, frequency_q1, frequency_q2, frequency_q3, frequency_q4, float('inf')]
-    monetary_bins = [0, monetary_q1, monetary_q2, monetary_q3, monetary_q4, float('inf')]
+def rfm_bin_edges(rfm):
+    # One pass over the three columns: row i holds the RFM_QUANTILES[i] edge of Recency, Frequency and Monetary.
+    return np.quantile(rfm[RFM_COLUMNS].to_numpy(dtype=float), RFM_QUANTILES, axis=0)
 
-    recency_labels = ['Baru Saja', 'Cukup Baru', 'Cukup Lama', 'Lama', 'Sangat Lama']
-    frequency_labels = ['Sangat Jarang', 'Jarang', 'Cukup Sering', 'Sering', 'Sangat Sering']
-    monetary_labels = ['Sangat Rendah', 'Rendah', 'Sedang', 'Tinggi', 'Sangat Tinggi']
+def rfm_bins(values, edges):
+    # Bin 0..4 per column, right-inclusive like the old pd.cut/"<=" checks: value <= edge i falls in bin i.
+    values = np.asarray(values, dtype=float)
+    return np.column_stack([np.searchsorted(edges[:, i], values[:, i], side='left') for i in range(len(RFM_COLUMNS))])
 
-    rfm['Recency_Category'] = pd.cut(rfm['Recency'], bins=recency_bins, labels=recency_labels)
-    rfm['Frequency_Category'] = pd.cut(rfm['Frequency'], bins=frequency_bins, labels=frequency_labels)
-    rfm['Monetary_Category'] = pd.cut(rfm['Monetary'], bins=monetary_bins, labels=monetary_labels)
+def categorize_rfm(rfm, edges=None):
+    if edges is None:
+        edges = rfm_bin_edges(rfm)
+    bins = rfm_bins(rfm[RFM_COLUMNS], edges)
+    for i, column in enumerate(RFM_COLUMNS):
+        rfm[f'{column}_Category'] = pd.Categorical.from_codes(bins[:, i], categories=RFM_LABELS[column])
 
     return rfm
 
+def cluster_legends(cluster_means, edges):
+    bins = rfm_bins(cluster_means[RFM_COLUMNS], edges)
+    recency, frequency, monetary = (np.asarray(RFM_LABELS[column])[bins[:, i]] for i, column in enumerate(RFM_COLUMNS))
+    return {
+        cluster: f"{r} Dibeli, Frekuensi {f}, dan Nilai Pembelian {m}"
+        for cluster, r, f, m in zip(cluster_means.index, recency, frequency, monetary)
+    }
+
 
 def cluster_rfm(rfm_scaled, n_clusters):
     kmeans = KMeans(n_clusters=n_clusters, init='k-means++', random_state=1)
@@ -99,50 +100,73 @@ def plot_interactive_pie_chart(rfm, cluster_labels, category_name, custom_legend
 
     return fig
 
-def show_cluster_table(rfm, cluster_label, custom_label, key_suffix):
-    st.markdown(f"##### Daftar Produk yang {custom_label}", unsafe_allow_html=True)
-    
+def cluster_page(rfm, cluster_label, products, search='', sort_by='NAMA BARANG', descending=False, page=1, page_size=PAGE_SIZES[0]):
     cluster_data = rfm[rfm['Cluster'] == cluster_label]
-    
-    if 'KATEGORI' in cluster_data.columns:
-        cluster_data = cluster_data.drop(columns=['KATEGORI'])
-    
-    st.dataframe(cluster_data, width=400, height=350, key=f"cluster_table_{cluster_label}_{key_suffix}")
+    names = product_names(products, cluster_data['PRODUCT_ID']).astype(str)
+
+    if search:
+        match = pd.Series(names).str.contains(search, case=False, regex=False).to_numpy()
+        cluster_data, names = cluster_data[match], names[match]
+
+    keys = names if sort_by == 'NAMA BARANG' else cluster_data[sort_by].to_numpy()
+    order = np.argsort(keys, kind='stable')
+    if descending:
+        order = order[::-1]
+
+    # Only the rows of the requested page are turned into a display frame.
+    rows = order[(page - 1) * page_size:page * page_size]
+    page_data = cluster_data.iloc[rows].drop(columns=['PRODUCT_ID', 'KATEGORI_ID'])
+    page_data.insert(0, 'NAMA BARANG', names[rows])
+    return page_data, len(order)
 
-def process_category(rfm_category, category_name, n_clusters, key_suffix=''):
-    if rfm_category.shape[0] > 0 and n_clusters > 0:
+def show_cluster_table(rfm, cluster_label, custom_label, products, key_suffix):
+    st.markdown(f"##### Daftar Produk yang {custom_label}", unsafe_allow_html=True)
+
+    key = f"cluster_table_{cluster_label}_{key_suffix}"
+    search_col, sort_col, order_col = st.columns([2, 2, 1])
+    search = search_col.text_input("Cari produk", key=f"{key}_search")
+    sort_by = sort_col.selectbox("Urutkan", SORT_COLUMNS, key=f"{key}_sort")
+    descending = order_col.checkbox("Menurun", key=f"{key}_desc")
+
+    page_size = st.session_state.get(f"{key}_page_size", PAGE_SIZES[0])
+    page = st.session_state.get(f"{key}_page", 1)
+    page_data, total = cluster_page(rfm, cluster_label, products, search, sort_by, descending, page, page_size)
+
+    n_pages = max(1, -(-total // page_size))
+    if page > n_pages:
+        # The filter shrank the result below the current page; start again from the first page.
+        page = st.session_state[f"{key}_page"] = 1
+        page_data, total = cluster_page(rfm, cluster_label, products, search, sort_by, descending, page, page_size)
+
+    st.dataframe(page_data, width=400, height=350, hide_index=True, key=key)
+
+    page_col, size_col = st.columns(2)
+    page_col.number_input(f"Halaman (dari {n_pages})", min_value=1, max_value=n_pages, step=1, key=f"{key}_page")
+    size_col.selectbox("Baris per halaman", PAGE_SIZES, key=f"{key}_page_size")
+    st.caption(f"{total} produk")
+
+def segment_category(rfm_category, n_clusters):
+    if rfm_category.shape[0] > 0 and n_clusters:
+        rfm_category = rfm_category.copy()
         scaler = StandardScaler()
         rfm_scaled = scaler.fit_transform(rfm_category[['Recency', 'Frequency', 'Monetary']])
         
         cluster_labels = cluster_rfm(rfm_scaled, n_clusters)
         rfm_category['Cluster'] = cluster_labels
 
-        rfm_category = categorize_rfm(rfm_category)
-
-        cluster_means = rfm_category.groupby('Cluster')[['Recency', 'Frequency', 'Monetary']].mean()
-
-        recency_quartiles = rfm_category['Recency'].quantile([0.2, 0.4, 0.6, 0.8])
-        frequency_quartiles = rfm_category['Frequency'].quantile([0.2, 0.4, 0.6, 0.8])
-        monetary_quartiles = rfm_category['Monetary'].quantile([0.2, 0.4, 0.6, 0.8])
-
-        def determine_category(value, quartiles, labels):
-            if value <= quartiles[0.2]:
-                return labels[0]
-            elif value <= quartiles[0.4]:
-                return labels[1]
-            elif value <= quartiles[0.6]:
-                return labels[2]
-            elif value <= quartiles[0.8]:
-                return labels[3]
-            else:
-                return labels[4]
-
-        custom_legends = {
-            cluster: f"{determine_category(mean_values['Recency'], recency_quartiles, ['Baru Saja', 'Cukup Baru', 'Cukup Lama', 'Lama', 'Sangat Lama'])} Dibeli, "
-                     f"Frekuensi {determine_category(mean_values['Frequency'], frequency_quartiles, ['Sangat Jarang', 'Jarang', 'Cukup Sering', 'Sering', 'Sangat Sering'])}, "
-                     f"dan Nilai Pembelian {determine_category(mean_values['Monetary'], monetary_quartiles, ['Sangat Rendah', 'Rendah', 'Sedang', 'Tinggi', 'Sangat Tinggi'])}"
-            for cluster, mean_values in cluster_means.iterrows()
-        }
+        edges = rfm_bin_edges(rfm_category)
+        rfm_category = categorize_rfm(rfm_category, edges)
+
+        cluster_means = rfm_category.groupby('Cluster')[RFM_COLUMNS].mean()
+        custom_legends = cluster_legends(cluster_means, edges)
+
+        return rfm_category, custom_legends
+
+    return None
+
+def process_category(segment, category_name, products, key_suffix=''):
+    if segment is not None:
+        rfm_category, custom_legends = segment
 
         col1, col2 = st.columns([1, 2])
 
@@ -182,29 +206,47 @@ def process_category(rfm_category, category_name, n_clusters, key_suffix=''):
 
         chart_col, table_col = st.columns(2)
         with chart_col:
-            fig = plot_interactive_pie_chart(rfm_category, cluster_labels, category_name, custom_legends)
+            fig = plot_interactive_pie_chart(rfm_category, rfm_category['Cluster'], category_name, custom_legends)
             st.plotly_chart(fig, use_container_width=True, key=plot_key)
 
         with table_col:
-            show_cluster_table(rfm_category, selected_cluster_num, selected_custom_label, key_suffix=f'{category_name.lower()}_{selected_cluster_num}')
+            show_cluster_table(rfm_category, selected_cluster_num, selected_custom_label, products, key_suffix=f'{key_suffix}_{category_name.lower()}_{selected_cluster_num}')
 
     else:
         st.error(f"Tidak ada data yang valid untuk clustering di kategori {category_name}.")
 
 def get_optimal_k(data_scaled):
+    # KMeans needs at least as many rows as clusters; a newly opened branch may have only a few products per category.
+    max_k = min(11, len(data_scaled))
+    if max_k < 3:
+        return None
     model = KMeans(random_state=1)
-    visualizer = KElbowVisualizer(model, k=(1, 11), timings=False)
+    # Draw on a standalone Figure instead of pyplot so run_per_branch's worker threads do not share pyplot state.
+    visualizer = KElbowVisualizer(model, k=(1, max_k), timings=False, ax=Figure().subplots())
     visualizer.fit(data_scaled)
     return visualizer.elbow_value_
 
-def show_dashboard(data, key_suffix=''):
- 
-    rfm = process_rfm(data)
-
-    rfm_ikan = rfm[rfm['KATEGORI'] == 'Ikan']
-    n_clusters_ikan = get_optimal_k(StandardScaler().fit_transform(rfm_ikan[['Recency', 'Frequency', 'Monetary']]))
-    process_category(rfm_ikan, 'Ikan', n_clusters_ikan, key_suffix)
-
-    rfm_aksesoris = rfm[rfm['KATEGORI'] == 'Aksesoris']
-    n_clusters_aksesoris = get_optimal_k(StandardScaler().fit_transform(rfm_aksesoris[['Recency', 'Frequency', 'Monetary']]))
-    process_category(rfm_aksesoris, 'Aksesoris', n_clusters_aksesoris, key_suffix)
\ No newline at end of file
+@st.cache_data(max_entries=CACHE_ENTRIES)
+@shared_cache
+def segment_products(data, products):
+    rfm = process_rfm(data, products)
+
+    segments = {}
+    for category_name in CATEGORIES:
+        rfm_category = rfm[rfm['KATEGORI_ID'] == category_id(products, category_name)]
+        n_clusters = None
+        if rfm_category.shape[0] > 0:
+            n_clusters = get_optimal_k(StandardScaler().fit_transform(rfm_category[['Recency', 'Frequency', 'Monetary']]))
+        segments[category_name] = segment_category(rfm_category, n_clusters)
+    return segments
+
+def segment_branch(branch, start=None, end=None, data_dir=DATA_DIR):
+    products = load_products(data_dir)
+    kategori_ids = [category_id(products, category_name) for category_name in CATEGORIES]
+    data = branch_transactions(branch, columns=['TANGGAL', 'PRODUCT_ID', 'KATEGORI_ID', 'TOTAL HR JUAL'],
+                               start=start, end=end, kategori_ids=kategori_ids, data_dir=data_dir)
+    return segment_products(data, products)
+
+def show_dashboard(segments, products, key_suffix=''):
+    for category_name in CATEGORIES:
+        process_category(segments[category_name], category_name, products, key_suffix)
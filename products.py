@@ -0,0 +1,52 @@
+import logging
+import pandas as pd
+import streamlit as st
+from shared_cache import shared_cache
+
+MASTER_DATA_FILE = 'MASTER DATA.xlsm'
+MASTER_SHEET_NAME = 'master_data'
+PRODUCT_COLUMNS = ['KODE BARANG', 'NAMA BARANG', 'KATEGORI']
+
+logger = logging.getLogger(__name__)
+
+# One master file: room for the current version and the one it replaces.
+@st.cache_data(max_entries=2)
+@shared_cache
+def load_product_dimension(master_path, sheet_name=MASTER_SHEET_NAME, version=None):
+    master = pd.read_excel(master_path, sheet_name=sheet_name, usecols=PRODUCT_COLUMNS)
+    master = master.dropna(subset=['KODE BARANG'])
+    master['KODE BARANG'] = master['KODE BARANG'].astype(str).str.strip()
+    master = master.drop_duplicates('KODE BARANG')
+
+    # Row position is the integer product id carried by the transaction frames.
+    products = pd.DataFrame({
+        'KODE BARANG': master['KODE BARANG'].to_numpy(),
+        'NAMA BARANG': master['NAMA BARANG'].to_numpy(),
+        'KATEGORI': pd.Categorical(master['KATEGORI']),
+    })
+    products.index.name = 'PRODUCT_ID'
+    return products
+
+def category_id(products, category_name):
+    categories = products['KATEGORI'].cat.categories
+    return categories.get_loc(category_name) if category_name in categories else -1
+
+def encode_products(data, products):
+    data = data.dropna(subset=['KODE BARANG'])
+    product_id = pd.Index(products['KODE BARANG']).get_indexer(data['KODE BARANG'].astype(str).str.strip())
+
+    unknown = product_id < 0
+    if unknown.any():
+        logger.warning("%d transaksi dengan KODE BARANG yang tidak ada di master data: %s",
+                       unknown.sum(), sorted(data.loc[unknown, 'KODE BARANG'].astype(str).unique())[:10])
+
+    kategori_id = products['KATEGORI'].cat.codes.to_numpy()[product_id]
+    kategori_id[unknown] = -1
+
+    data = data.drop(columns=[c for c in PRODUCT_COLUMNS if c in data.columns])
+    data['PRODUCT_ID'] = product_id.astype('int32')
+    data['KATEGORI_ID'] = kategori_id.astype('int8')
+    return data.reset_index(drop=True)
+
+def product_names(products, product_ids):
+    return products['NAMA BARANG'].to_numpy()[product_ids]
@@ -0,0 +1,143 @@
+import functools
+import logging
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from branches import DATA_DIR, data_version, discover_branches, run_per_branch, load_products
+from sales_forecast import forecast_branch
+from product_clustering import segment_branch
+from shared_cache import cache_key, code_version, get_shared_cache
+
+logger = logging.getLogger(__name__)
+
+class BackgroundThreadFilter(logging.Filter):
+    # The refresh thread and its per-branch workers run outside any script run on purpose and st.cache_data works
+    # without one, so drop the "missing ScriptRunContext" warning every cached call logs from them.
+    def filter(self, record):
+        return not threading.current_thread().name.startswith(('refresh', 'branch'))
+
+logging.getLogger(get_script_run_ctx.__module__).addFilter(BackgroundThreadFilter())
+
+Snapshot = namedtuple('Snapshot', ['version', 'as_of', 'branches', 'products', 'forecasts', 'segments'])
+ARTIFACT_NAME = 'snapshot'
+# A failed build is retried after this long even if the workbooks did not change (e.g. a locked SQLite file).
+RETRY_SECONDS = 60
+
+def compute_snapshot(version, data_dir=DATA_DIR):
+    branches = discover_branches(data_dir)
+    as_of = datetime.fromtimestamp(max(mtime for _, mtime, _ in version) / 1e9) if version else None
+    return Snapshot(
+        version=version,
+        as_of=as_of,
+        branches=branches,
+        products=load_products(data_dir),
+        forecasts=run_per_branch(functools.partial(forecast_branch, data_dir=data_dir), branches),
+        segments=run_per_branch(functools.partial(segment_branch, data_dir=data_dir), branches),
+    )
+
+def snapshot_artifact(snapshot):
+    # Plain dicts/lists of the forecasts and segments, read by api_server without recomputing anything.
+    products = snapshot.products
+    branches = {}
+    for branch in snapshot.branches:
+        forecast = []
+        if snapshot.forecasts[branch] is not None:
+            daily_profit, _, _, _, hw_forecast_future = snapshot.forecasts[branch]
+            # Same week labels as the dashboard chart: the forecast continues after the last historical week.
+            forecast_dates = pd.date_range(daily_profit.index[-1], periods=len(hw_forecast_future) + 1, freq='W')[1:]
+            forecast = [{'tanggal': f"{date:%Y-%m-%d}", 'laba': float(laba)} for date, laba in zip(forecast_dates, hw_forecast_future)]
+        segments = {}
+        for category_name, segment in snapshot.segments[branch].items():
+            rows = []
+            if segment is not None:
+                rfm, custom_legends = segment
+                rows = pd.DataFrame({
+                    'kode_barang': products['KODE BARANG'].to_numpy()[rfm['PRODUCT_ID']],
+                    'nama_barang': products['NAMA BARANG'].to_numpy()[rfm['PRODUCT_ID']],
+                    'cluster': rfm['Cluster'].astype(int),
+                    'segment': rfm['Cluster'].map(custom_legends),
+                    'recency': rfm['Recency'].astype(int),
+                    'frequency': rfm['Frequency'].astype(int),
+                    'monetary': rfm['Monetary'].astype(float),
+                }).to_dict('records')
+            segments[category_name] = rows
+        branches[branch] = {
+            'forecast': forecast,
+            'segments': segments,
+        }
+    return {
+        'version': cache_key(code_version(), snapshot.version)[:16],
+        'as_of': snapshot.as_of.isoformat(timespec='seconds') if snapshot.as_of else None,
+        'branches': branches,
+    }
+
+def publish_snapshot(snapshot):
+    cache = get_shared_cache()
+    if cache is not None:
+        artifact = snapshot_artifact(snapshot)
+        cache.publish(ARTIFACT_NAME, artifact['version'], artifact)
+
+class RefreshWorker:
+    # Serves the last finished Snapshot and rebuilds a new one in the background when the workbooks change.
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='refresh')
+        self._snapshot = None
+        self._pending = None
+        self._failed_version = None
+        self._failed_at = None
+        self.error = None
+
+    def _refresh(self, version):
+        try:
+            snapshot = compute_snapshot(version, self.data_dir)
+        except Exception as e:
+            # A workbook that is still being copied fails to parse; retry once its version changes or after RETRY_SECONDS.
+            logger.exception("Gagal memperbarui data")
+            with self._lock:
+                self._failed_version = version
+                self._failed_at = time.monotonic()
+                self.error = e
+            raise
+        with self._lock:
+            self._snapshot = snapshot
+            self._failed_version = None
+            self.error = None
+        try:
+            publish_snapshot(snapshot)
+        except Exception:
+            logger.exception("Gagal menyimpan hasil untuk API")
+        return snapshot
+
+    def refresh_if_stale(self):
+        version = data_version(self.data_dir)
+        with self._lock:
+            if self._pending is not None and not self._pending.done():
+                return self._pending
+            current = self._snapshot.version if self._snapshot is not None else None
+            if version == current:
+                return None
+            if version == self._failed_version and time.monotonic() - self._failed_at < RETRY_SECONDS:
+                return None
+            self._pending = self._executor.submit(self._refresh, version)
+            return self._pending
+
+    def get(self):
+        # (snapshot, refreshing, error); snapshot is None only while no build has succeeded yet.
+        pending = self.refresh_if_stale()
+        if self._snapshot is None:
+            # Nothing to serve yet, the very first visitor waits for the initial build.
+            wait([pending or self._pending])
+        refreshing = pending is not None and not pending.done()
+        return self._snapshot, refreshing, self.error
+
+@st.cache_resource
+def get_refresh_worker(data_dir=DATA_DIR):
+    return RefreshWorker(data_dir)
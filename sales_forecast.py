@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+import streamlit as st
+import plotly.graph_objects as go
+from branches import CACHE_ENTRIES, DATA_DIR, branch_transactions
+from shared_cache import shared_cache
+
+# Holt-Winters settings per branch; branches not listed use the forecast_profit defaults.
+BRANCH_FORECAST_PARAMS = {
+    'Bobby Aquatic 2': dict(trend='mul', seasonal='add', seasonal_period=50),
+}
+BRANCH_COLORS = ['blue', 'orange', 'green', 'red', 'brown', 'teal', 'olive', 'magenta']
+HOVER_TEMPLATE = 'Tanggal: %{x}<br>Laba: Rp%{y:,.0f}<extra></extra>'
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+@shared_cache
+def forecast_profit(data, seasonal_period=13, forecast_horizon=13, trend='add', seasonal='mul'):
+    daily_profit = data[['TANGGAL', 'LABA']].copy()
+    daily_profit['TANGGAL'] = pd.to_datetime(daily_profit['TANGGAL'])
+    daily_profit = daily_profit.groupby('TANGGAL').sum()
+    daily_profit = daily_profit[~daily_profit.index.duplicated(keep='first')]
+
+    daily_profit = daily_profit.resample('W').mean().interpolate()
+
+    train_size = int(len(daily_profit) * 0.9)
+    train, test = daily_profit[:train_size], daily_profit[train_size:]
+
+    # Holt-Winters needs two full seasonal cycles to start; a newly opened branch gets no forecast until then.
+    if len(train) < 2 * seasonal_period:
+        return None
+
+    hw_model = ExponentialSmoothing(train, trend=trend, seasonal=seasonal, seasonal_periods=seasonal_period).fit()
+
+    hw_forecast_future = hw_model.forecast(forecast_horizon)
+    test_forecast = hw_model.forecast(len(test))
+
+    fitted_values = hw_model.fittedvalues
+
+    return daily_profit, fitted_values, test, test_forecast, hw_forecast_future
+
+def forecast_branch(branch, start=None, end=None, data_dir=DATA_DIR):
+    data = branch_transactions(branch, columns=['TANGGAL', 'LABA'], start=start, end=end, data_dir=data_dir)
+    return forecast_profit(data, **BRANCH_FORECAST_PARAMS.get(branch, {}))
+
+def sum_forecasts(forecasts):
+    # Combined view = sum of the per-branch aggregates, no refit on concatenated raw rows.
+    daily_profit = pd.concat([f[0] for f in forecasts]).groupby(level=0).sum()
+
+    # Branches with different history lengths split train/test at different weeks. Sum the in-sample
+    # predictions week by week where every branch has one; the test part is where all of them are out of sample.
+    predictions = pd.concat([pd.concat([f[1], f[3]]) for f in forecasts], axis=1).sum(axis=1, min_count=len(forecasts)).dropna()
+    train_end = max(f[1].index[-1] for f in forecasts)
+    fitted_values = predictions[predictions.index <= train_end]
+    test_forecast = predictions[predictions.index > train_end]
+    test = daily_profit.loc[test_forecast.index]
+
+    # The future forecast is read as the weeks after each branch's last history week, so add it up by position.
+    horizon = min(len(f[4]) for f in forecasts)
+    hw_forecast_future = pd.Series(
+        np.sum([f[4].to_numpy()[:horizon] for f in forecasts], axis=0),
+        index=pd.date_range(daily_profit.index[-1], periods=horizon + 1, freq='W')[1:],
+    )
+    return daily_profit, fitted_values, test, test_forecast, hw_forecast_future
+
+def add_forecast_traces(fig, daily_profit, fitted_values, test, test_forecast, hw_forecast_future,
+                        selected_years, name, color, historical_color=None):
+    filtered_data = daily_profit[daily_profit.index.year.isin(selected_years)]
+    filtered_fitted_values = fitted_values[fitted_values.index.year.isin(selected_years)]
+    filtered_test = test[test.index.year.isin(selected_years)]
+    filtered_test_forecast = test_forecast[test_forecast.index.year.isin(selected_years)]
+
+    fig.add_trace(go.Scatter(x=filtered_data.index, y=filtered_data['LABA'], mode='lines', name=f'Data Historis {name}', line=dict(color=historical_color), hovertemplate=HOVER_TEMPLATE))
+
+    if filtered_fitted_values.empty or filtered_test.empty or filtered_test_forecast.empty:
+        return
+
+    shifted_test_forecast = filtered_test_forecast.shift(1)
+    combined_test_data = pd.concat([filtered_fitted_values.iloc[[-1]], shifted_test_forecast])
+    fig.add_trace(go.Scatter(x=combined_test_data.index, y=combined_test_data, mode='lines', line=dict(dash='dot', color=color), showlegend=False, hovertemplate=HOVER_TEMPLATE))
+
+    combined_forecast = pd.concat([shifted_test_forecast.iloc[[-1]], hw_forecast_future])
+    forecast_dates = pd.date_range(start=filtered_data.index[-1], periods=len(combined_forecast), freq='W')
+    fig.add_trace(go.Scatter(x=forecast_dates, y=combined_forecast, mode='lines', name=f'Prediksi Laba {name}', line=dict(dash='dot', color=color), hovertemplate=HOVER_TEMPLATE))
+
+def show_dashboard(forecasts, key_suffix=''):
+    combined = sum_forecasts(list(forecasts.values()))
+    daily_profit, _, _, _, hw_forecast_future = combined
+
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        title_suffix = f" {next(iter(forecasts))}" if len(forecasts) == 1 else ""
+        last_week_profit = daily_profit['LABA'].iloc[-1]
+        predicted_profit_next_week = hw_forecast_future.iloc[0]
+        total_profit_last_week = last_week_profit * 7
+        profit_change_percentage = ((predicted_profit_next_week - last_week_profit) / last_week_profit) * 100 if last_week_profit else 0
+
+        arrow = "🡅" if profit_change_percentage > 0 else "🡇"
+        color = "green" if profit_change_percentage > 0 else "red"
+
+        st.markdown(f"""
+            <div style="border: 2px solid #dcdcdc; padding: 10px; margin-bottom: 10px; border-radius: 5px; text-align: center;">
+                <span style="font-size: 14px;">Total Laba Minggu Ini{title_suffix}</span><br>
+                <span style="font-size: 32px; font-weight: bold;">{total_profit_last_week:,.2f}</span>
+            </div>
+            <div style="border: 2px solid #dcdcdc; padding: 10px; margin-bottom: 10px; border-radius: 5px; text-align: center;">
+                <span style="font-size: 14px;">Rata-rata Laba Harian Minggu Ini{title_suffix}</span><br>
+                <span style="font-size: 32px; font-weight: bold;">{last_week_profit:,.2f}</span>
+            </div>
+            <div style="border: 2px solid #dcdcdc; padding: 10px; margin-bottom: 10px; border-radius: 5px; text-align: center;">
+                <span style="font-size: 14px;">Prediksi Rata-rata Laba Harian Minggu Depan{title_suffix}</span><br>
+                <span style="font-size: 32px; font-weight: bold;">{predicted_profit_next_week:,.2f}</span>
+                <br><span style='color:{color}; font-size:24px;'>{arrow} {profit_change_percentage:.2f}%</span>
+            </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+
+        st.markdown("<h3 style='font-size:20px;'>Data Historis dan Prediksi Rata-rata Laba Harian Per Minggu</h3>", unsafe_allow_html=True)
+
+        historical_years = daily_profit.index.year.unique()
+        default_years = [2024] if 2024 in historical_years else []
+        selected_years = st.multiselect('Filter Tahun untuk Grafik', options=historical_years, default=default_years, key=f"years_{key_suffix}")
+
+        show_combined_sales = False
+        if len(forecasts) > 1:
+            show_combined_sales = st.checkbox("Gabungkan Grafik", key=f"combine_{key_suffix}")
+
+        fig = go.Figure()
+        fig.update_layout(margin=dict(t=8), height=320)
+
+        if show_combined_sales:
+            add_forecast_traces(fig, *combined, selected_years, 'Gabungan', 'purple', historical_color='purple')
+        else:
+            for i, (name, forecast) in enumerate(forecasts.items()):
+                add_forecast_traces(fig, *forecast, selected_years, name, BRANCH_COLORS[i % len(BRANCH_COLORS)])
+
+        st.plotly_chart(fig, key=f"plot_{key_suffix}")
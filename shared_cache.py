@@ -0,0 +1,215 @@
+import functools
+import glob
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import numpy as np
+import pandas as pd
+
+# Set BOBBY_SHARED_CACHE to an empty string to turn the host-wide cache off.
+# The file outlives deploys. Keys cover the source of every module in this folder, so entries written by an
+# older version of the app are never read again; delete the file after upgrading to reclaim the space, and
+# always after upgrading pandas, statsmodels or scikit-learn, whose results the source hash cannot see.
+CACHE_PATH = os.environ.get('BOBBY_SHARED_CACHE', os.path.join('.cache', 'shared_cache.sqlite'))
+MAX_BYTES = int(os.environ.get('BOBBY_SHARED_CACHE_MAX_MB', '1024')) * 2 ** 20
+LEASE_SECONDS = 600
+POLL_SECONDS = 0.25
+# Bump to invalidate every entry, e.g. when a pickled result changes shape for a reason outside this folder.
+CACHE_SCHEMA = 1
+
+logger = logging.getLogger(__name__)
+
+def _hash_value(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(b'DataFrame')
+        digest.update(pickle.dumps((list(value.columns), [str(t) for t in value.dtypes])))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(b'Series')
+        digest.update(pickle.dumps((value.name, str(value.dtype))))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(pickle.dumps((value.shape, str(value.dtype))))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(pickle.dumps((type(value).__name__, len(value))))
+        for item in value:
+            _hash_value(digest, item)
+    elif isinstance(value, dict):
+        digest.update(pickle.dumps(('dict', len(value))))
+        for key in sorted(value, key=repr):
+            _hash_value(digest, key)
+            _hash_value(digest, value[key])
+    else:
+        digest.update(pickle.dumps(value))
+
+def cache_key(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        _hash_value(digest, part)
+    return digest.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    # A cached function's result also depends on everything it calls, so hash all modules, not just its own source.
+    digest = hashlib.sha256(str(CACHE_SCHEMA).encode())
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py'))):
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+class SharedCache:
+    # Pickled results in one SQLite file, shared by every dashboard process on the host.
+
+    def __init__(self, path=CACHE_PATH, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connection()
+        conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        conn.execute("CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, expires REAL NOT NULL)")
+        # Named results (e.g. the latest snapshot) that readers look up by name; never evicted.
+        conn.execute("CREATE TABLE IF NOT EXISTS published (name TEXT PRIMARY KEY, version TEXT NOT NULL, value BLOB NOT NULL, created REAL NOT NULL)")
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; writes use explicit BEGIN IMMEDIATE so concurrent writers queue on busy_timeout.
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        conn = self._connection()
+        row = conn.execute("SELECT value, last_access FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return False, None
+        now = time.time()
+        # Touch at most once a minute so read-heavy workers do not serialise on the write lock.
+        if now - row[1] > 60:
+            conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+        return True, pickle.loads(row[0])
+
+    def put(self, key, value):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            logger.warning("Hasil %s (%d byte) lebih besar dari batas shared cache, tidak disimpan", key, len(blob))
+            return
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                         (key, blob, len(blob), time.time()))
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+    def _acquire(self, key):
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT expires FROM leases WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[0] > now:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute("INSERT OR REPLACE INTO leases (key, expires) VALUES (?, ?)", (key, now + LEASE_SECONDS))
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _release(self, key):
+        self._connection().execute("DELETE FROM leases WHERE key = ?", (key,))
+
+    def publish(self, name, version, value):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._connection().execute("INSERT OR REPLACE INTO published (name, version, value, created) VALUES (?, ?, ?, ?)",
+                                   (name, version, blob, time.time()))
+
+    def reader_connection(self):
+        # For callers that serialise their own access across threads (see api_server.ArtifactReader).
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+
+    def published_version(self, name, conn=None):
+        row = (conn or self._connection()).execute("SELECT version FROM published WHERE name = ?", (name,)).fetchone()
+        return row[0] if row is not None else None
+
+    def published(self, name, conn=None):
+        row = (conn or self._connection()).execute("SELECT version, value FROM published WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None, None
+        return row[0], pickle.loads(row[1])
+
+    def get_or_compute(self, key, compute):
+        while True:
+            hit, value = self.get(key)
+            if hit:
+                return value
+            if self._acquire(key):
+                break
+            # Another process or thread is computing this key; wait for its result or for the lease to expire.
+            time.sleep(POLL_SECONDS)
+
+        try:
+            hit, value = self.get(key)
+            if not hit:
+                value = compute()
+                self.put(key, value)
+            return value
+        finally:
+            self._release(key)
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_shared_cache():
+    global _cache
+    if not CACHE_PATH:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SharedCache(CACHE_PATH, MAX_BYTES)
+    return _cache
+
+def shared_cache(func):
+    # Content-addressed: the key covers the app's code version, the function name and the hashed arguments.
+    name = f"{func.__module__}.{func.__qualname__}"
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = get_shared_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = cache_key(code_version(), name, dict(bound.arguments))
+        return cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+    return wrapper
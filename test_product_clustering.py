@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+from generate_synthetic_data import generate_products, generate_sales
+from product_clustering import CATEGORIES, categorize_rfm, cluster_legends, process_rfm, rfm_bin_edges
+from products import category_id, encode_products
+
+RECENCY_LABELS = ['Baru Saja', 'Cukup Baru', 'Cukup Lama', 'Lama', 'Sangat Lama']
+FREQUENCY_LABELS = ['Sangat Jarang', 'Jarang', 'Cukup Sering', 'Sering', 'Sangat Sering']
+MONETARY_LABELS = ['Sangat Rendah', 'Rendah', 'Sedang', 'Tinggi', 'Sangat Tinggi']
+LABELS = {'Recency': RECENCY_LABELS, 'Frequency': FREQUENCY_LABELS, 'Monetary': MONETARY_LABELS}
+
+
+# categorize_rfm and the legend code of segment_category before the vectorized binning.
+def reference_categorize_rfm(rfm):
+    rfm = rfm.copy()
+    for column, labels in LABELS.items():
+        quantiles = [rfm[column].quantile(q) for q in (0.2, 0.4, 0.6, 0.8)]
+        rfm[f'{column}_Category'] = pd.cut(rfm[column], bins=[0, *quantiles, float('inf')], labels=labels)
+    return rfm
+
+def reference_legends(rfm):
+    def determine_category(value, quartiles, labels):
+        if value <= quartiles[0.2]:
+            return labels[0]
+        elif value <= quartiles[0.4]:
+            return labels[1]
+        elif value <= quartiles[0.6]:
+            return labels[2]
+        elif value <= quartiles[0.8]:
+            return labels[3]
+        else:
+            return labels[4]
+
+    quartiles = {column: rfm[column].quantile([0.2, 0.4, 0.6, 0.8]) for column in LABELS}
+    cluster_means = rfm.groupby('Cluster')[list(LABELS)].mean()
+    return {
+        cluster: f"{determine_category(mean_values['Recency'], quartiles['Recency'], RECENCY_LABELS)} Dibeli, "
+                 f"Frekuensi {determine_category(mean_values['Frequency'], quartiles['Frequency'], FREQUENCY_LABELS)}, "
+                 f"dan Nilai Pembelian {determine_category(mean_values['Monetary'], quartiles['Monetary'], MONETARY_LABELS)}"
+        for cluster, mean_values in cluster_means.iterrows()
+    }
+
+def synthetic_rfm_frames():
+    catalog = generate_products(500)
+    products = pd.DataFrame({
+        'KODE BARANG': catalog['KODE BARANG'],
+        'NAMA BARANG': catalog['NAMA BARANG'],
+        'KATEGORI': pd.Categorical(catalog['KATEGORI']),
+    }).rename_axis('PRODUCT_ID')
+
+    frames = []
+    for seed in range(3):
+        sales = pd.concat([generate_sales(catalog, year, 5000, seed=seed * 10 + year) for year in (2023, 2024)])
+        rfm = process_rfm(encode_products(sales, products), products)
+        frames.extend(rfm[rfm['KATEGORI_ID'] == category_id(products, name)].reset_index(drop=True) for name in CATEGORIES)
+    return frames
+
+@pytest.fixture(scope='module')
+def rfm_frames():
+    return synthetic_rfm_frames()
+
+def test_categorize_rfm_matches_pd_cut(rfm_frames):
+    for rfm in rfm_frames:
+        expected = reference_categorize_rfm(rfm)
+        result = categorize_rfm(rfm.copy())
+        for column in LABELS:
+            category = f'{column}_Category'
+            assert list(result[category].cat.categories) == LABELS[column]
+            # pd.cut leaves values <= 0 (a product sold on the last day has Recency 0) unlabelled.
+            labelled = expected[category].notna()
+            pd.testing.assert_series_equal(result[category][labelled].astype(str), expected[category][labelled].astype(str))
+            assert (result.loc[~labelled, column] <= 0).all()
+
+def test_cluster_legends_match_determine_category(rfm_frames):
+    rng = np.random.default_rng(0)
+    for rfm in rfm_frames:
+        rfm = rfm.assign(Cluster=rng.integers(0, 4, len(rfm)))
+        cluster_means = rfm.groupby('Cluster')[list(LABELS)].mean()
+        assert cluster_legends(cluster_means, rfm_bin_edges(rfm)) == reference_legends(rfm)
+
+def test_zero_gets_lowest_label():
+    rfm = pd.DataFrame({'Recency': [0, 3, 7, 10, 30], 'Frequency': [1, 2, 3, 4, 5], 'Monetary': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    assert pd.isna(reference_categorize_rfm(rfm)['Recency_Category'][0])
+    assert categorize_rfm(rfm)['Recency_Category'][0] == 'Baru Saja'
+
+def test_repeated_edges_are_binned_instead_of_raising():
+    rfm = pd.DataFrame({'Recency': np.arange(1, 11), 'Frequency': [1] * 8 + [2, 3], 'Monetary': np.arange(1.0, 11.0)})
+    with pytest.raises(ValueError, match='Bin edges must be unique'):
+        reference_categorize_rfm(rfm)
+    # Edges are [1, 1, 1, 1.2]: the ones fall in the first bin, 2 and 3 lie above the last edge.
+    assert list(categorize_rfm(rfm)['Frequency_Category']) == ['Sangat Jarang'] * 8 + ['Sangat Sering'] * 2
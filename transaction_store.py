@@ -0,0 +1,118 @@
+import os
+import sqlite3
+import threading
+import pandas as pd
+
+# Opt-in: set BOBBY_TRANSACTION_STORE to a file path to keep the ingested transactions in SQLite.
+STORE_PATH = os.environ.get('BOBBY_TRANSACTION_STORE', '')
+
+# Frame column -> SQL column. TANGGAL is stored as days since 1970-01-01 so range filters compare integers.
+COLUMNS = {
+    'TANGGAL': 'tanggal',
+    'PRODUCT_ID': 'product_id',
+    'KATEGORI_ID': 'kategori_id',
+    'JUMLAH': 'jumlah',
+    'TOTAL HR JUAL': 'total_hr_jual',
+    'LABA': 'laba',
+}
+DTYPES = {'PRODUCT_ID': 'int32', 'KATEGORI_ID': 'int8'}
+EPOCH = pd.Timestamp('1970-01-01')
+
+def to_day_number(value):
+    return (pd.Timestamp(value).normalize() - EPOCH).days
+
+class TransactionStore:
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connection()
+        conn.execute("CREATE TABLE IF NOT EXISTS branches (branch_id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, version TEXT)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS transactions ("
+            "branch_id INTEGER NOT NULL, tanggal INTEGER NOT NULL, product_id INTEGER NOT NULL, kategori_id INTEGER NOT NULL, "
+            "jumlah REAL, total_hr_jual REAL, laba REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS transactions_branch_tanggal ON transactions (branch_id, tanggal)")
+        conn.execute("CREATE INDEX IF NOT EXISTS transactions_branch_product ON transactions (branch_id, product_id)")
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _branch_id(self, branch):
+        row = self._connection().execute("SELECT branch_id FROM branches WHERE name = ?", (branch,)).fetchone()
+        return row[0] if row is not None else None
+
+    def has_version(self, branch, version):
+        row = self._connection().execute("SELECT version FROM branches WHERE name = ?", (branch,)).fetchone()
+        return row is not None and row[0] == repr(version)
+
+    def ingest(self, branch, data, version):
+        data = data.dropna(subset=['TANGGAL'])
+        tanggal = (pd.to_datetime(data['TANGGAL']).dt.normalize() - EPOCH).dt.days.to_numpy()
+        columns = [tanggal] + [data[c].to_numpy() for c in list(COLUMNS)[1:]]
+
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self.has_version(branch, version):
+                conn.execute("ROLLBACK")
+                return
+            conn.execute("INSERT OR IGNORE INTO branches (name) VALUES (?)", (branch,))
+            branch_id = self._branch_id(branch)
+            conn.execute("DELETE FROM transactions WHERE branch_id = ?", (branch_id,))
+            conn.executemany(
+                "INSERT INTO transactions (branch_id, tanggal, product_id, kategori_id, jumlah, total_hr_jual, laba) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                zip([branch_id] * len(data), *(c.tolist() for c in columns))
+            )
+            conn.execute("UPDATE branches SET version = ? WHERE branch_id = ?", (repr(version), branch_id))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def query(self, branch, columns=None, start=None, end=None, kategori_ids=None, product_ids=None):
+        columns = list(columns or COLUMNS)
+        branch_id = self._branch_id(branch)
+        if branch_id is None:
+            return pd.DataFrame(columns=columns)
+
+        where, params = ["branch_id = ?"], [branch_id]
+        if start is not None:
+            where.append("tanggal >= ?")
+            params.append(to_day_number(start))
+        if end is not None:
+            where.append("tanggal <= ?")
+            params.append(to_day_number(end))
+        for column, values in (('kategori_id', kategori_ids), ('product_id', product_ids)):
+            if values is not None:
+                values = [int(v) for v in values]
+                where.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+
+        sql = f"SELECT {', '.join(COLUMNS[c] for c in columns)} FROM transactions WHERE {' AND '.join(where)}"
+        rows = self._connection().execute(sql, params).fetchall()
+        data = pd.DataFrame.from_records(rows, columns=columns)
+        if 'TANGGAL' in data.columns:
+            data['TANGGAL'] = pd.to_datetime(data['TANGGAL'], unit='D')
+        return data.astype({c: t for c, t in DTYPES.items() if c in data.columns})
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_transaction_store():
+    global _store
+    if not STORE_PATH:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = TransactionStore(STORE_PATH)
+    return _store